@@ -5,28 +5,46 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
+import gzip
+import hashlib
 import html
+import json
 import math
+import os
+import pickle
 import re
 import shutil
 import sys
+import time
+from collections import Counter
 from dataclasses import dataclass
-from datetime import datetime
-from io import StringIO
+from datetime import date, datetime
+from io import StringIO, TextIOWrapper
+from itertools import accumulate, chain
 from pathlib import Path
-from urllib.error import HTTPError, URLError
+from types import MappingProxyType
+from typing import BinaryIO, Callable, Iterable, NamedTuple, TextIO
 from urllib.parse import quote
-from urllib.request import urlopen
-
-from openpyxl import Workbook, load_workbook
 
 MAX_POINTS = 10
 NUMBER_PATTERN = re.compile(
     r"(?<!\w)(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?(?:[kKmMbBtT%])?(?!\w)"
 )
+POINTS_REQUIRED_COLUMNS = ("order", "title", "content", "image_path", "image_caption")
+DISTRIBUTION_REQUIRED_COLUMNS = ("category", "amount_btc", "color")
+LINE_BREAK_PATTERN = re.compile(r"\r?\n")
 GOOGLE_SHEET_ID_PATTERN = re.compile(r"/spreadsheets/d/([a-zA-Z0-9-_]+)")
+GOOGLE_SHEET_CACHE_DIR = Path.home() / ".cache" / "newsletter"
+DEFAULT_CACHE_TTL_SECONDS = 60.0
+HISTORY_SNAPSHOT_PATTERN = re.compile(
+    r"newsletter_(\d{4}-\d{2}-\d{2})_(\d{4})(\d{2})?(?:_([0-9a-f]+))?\.xlsx"
+)
+WORKBOOK_CACHE_DIR = Path.home() / ".cache" / "newsletter" / "workbooks"
+SCRIPT_PATH = Path(__file__).resolve()
+BASE_DIR = SCRIPT_PATH.parent
 
-DEFAULT_META = {
+DEFAULT_META = MappingProxyType({
     "eyebrow": "Globalite Macro Brief",
     "main_title": "WEEKLY TOP 10 ARGUMENTS",
     "subtitle": "A clear weekly macro summary with the key arguments that matter.",
@@ -59,7 +77,7 @@ DEFAULT_META = {
     "footer_linkedin_icon": "public/linkedin.png",
     "image_dir": ".",
     "auto_image_by_order": "true",
-}
+})
 
 DEFAULT_DISTRIBUTION = [
     ("Individuals", 13660000, "rgb(255, 66, 2)"),
@@ -72,6 +90,141 @@ DEFAULT_DISTRIBUTION = [
     ("Other Entities", 421000, "rgb(255, 227, 180)"),
 ]
 
+BLOCK_INDENT = " " * 16
+
+NEWSLETTER_CSS = """\
+      body {
+        margin: 0;
+        padding: 0;
+        background: #f5f5f5;
+        font-family: "Poppins", Arial, sans-serif;
+        color: #1f1f1f;
+        -webkit-print-color-adjust: exact;
+        print-color-adjust: exact;
+      }
+      table { border-collapse: collapse; }
+      img { border: 0; display: block; max-width: 100%; height: auto; }
+      a { color: #ff4202; text-decoration: none; }
+      .toolbar { width: 100%; max-width: 680px; margin: 0 auto; display: flex; justify-content: flex-end; padding: 12px 0 8px; }
+      .download-pdf-btn { border: 1px solid #ff4202; border-radius: 999px; padding: 8px 14px; background: #ffffff; color: #ff4202; font: 600 12px/1 "Poppins", Arial, sans-serif; cursor: pointer; }
+      .download-pdf-btn:hover { background: #fff4ef; }
+      .wrapper { width: 100%; background: #f5f5f5; padding: 32px 0; }
+      .container { width: 680px; max-width: 680px; background: #ffffff; border: 1px solid #e6e6e6; border-radius: 16px; overflow: hidden; }
+      .divider { height: 4px; background: #ff4202; line-height: 4px; }
+      .header { padding: 28px 32px 18px; }
+      .logo { margin: 0 0 16px; text-align: center; }
+      .logo img { width: 190px; margin: 0 auto; }
+      .eyebrow { color: #ff4202; font-weight: 700; font-size: 12px; letter-spacing: 1px; text-transform: uppercase; margin: 0 0 6px; }
+      h1 { margin: 6px 0 6px; font-size: 28px; line-height: 1.2; font-weight: 700; }
+      .subtitle { margin: 0; color: #5f5f5f; font-size: 14px; line-height: 1.6; }
+      .block-height { margin: 12px 0 0; display: inline-block; font-size: 12px; line-height: 1.4; color: #8f3a1a; background: #fff1eb; border: 1px solid #ffd6c8; border-radius: 999px; padding: 6px 10px; }
+      .section { padding: 16px 32px; border-top: 1px solid #f0f0f0; }
+      .section h2 { margin: 0 0 20px; font-size: 18px; font-weight: 700; }
+      .section p { margin: 0; font-size: 14px; line-height: 1.6; }
+      .section p + p { margin-top: 12px; }
+      .section ul { margin: 20px 0 20px 18px; padding: 0; font-size: 14px; line-height: 1.6; }
+      .section li { margin-bottom: 8px; }
+      .section .point-source { margin-top: 14px; font-size: 11px; line-height: 1.5; color: #8a8a8a; }
+      .image { margin: 20px 0; }
+      .image img { width: 100%; border-radius: 12px; border: 1px solid #e6e6e6; }
+      .caption { font-size: 12px; color: #7a7a7a; margin-top: 6px; }
+      .extra-images { margin: 14px 0 0; display: grid; gap: 10px; }
+      .extra-images img { width: 100%; border-radius: 12px; border: 1px solid #e6e6e6; }
+      .snapshot { background: #fcfcfc; }
+      .snapshot-intro { margin: 0 0 14px; font-size: 14px; color: #4f4f4f; }
+      .snapshot-grid { display: grid; grid-template-columns: 1fr 1fr 1fr; gap: 12px; }
+      .snapshot-card { border: 1px solid #ececec; border-radius: 12px; padding: 12px; background: #ffffff; }
+      .snapshot-card h3 { margin: 0 0 10px; font-size: 14px; font-weight: 700; color: #1f1f1f; }
+      .snapshot-ownership-viz { display: flex; justify-content: center; margin: 0 0 10px; }
+      .snapshot-donut { width: 132px; height: 132px; display: block; }
+      .snapshot-donut-segment { fill: none; stroke-width: 24; transform: rotate(-90deg); transform-origin: 60px 60px; }
+      .snapshot-donut-label { font-size: 10px; fill: #8a8a8a; }
+      .snapshot-donut-value { font-size: 10px; fill: #5f5f5f; }
+      .snapshot-bar { width: 100%; height: 24px; border: 1px solid #e6e6e6; border-radius: 8px; overflow: hidden; display: flex; }
+      .snapshot-bar-segment { height: 100%; min-width: 2px; }
+      .snapshot-legend { margin-top: 10px; display: grid; gap: 6px; }
+      .snapshot-legend-item { display: grid; grid-template-columns: 12px 1fr auto; align-items: center; gap: 8px; }
+      .snapshot-dot { width: 10px; height: 10px; border-radius: 999px; display: inline-block; }
+      .snapshot-name { font-size: 12px; color: #3f3f3f; }
+      .snapshot-value { font-size: 12px; color: #5f5f5f; white-space: nowrap; }
+      .snapshot-circ-value { margin: 0 0 8px; font-size: 22px; font-weight: 700; color: #1f1f1f; }
+      .snapshot-progress-track { width: 100%; height: 14px; border: 1px solid #e0e0e0; border-radius: 999px; background: #f0f0f0; overflow: hidden; }
+      .snapshot-progress-fill { height: 100%; background: linear-gradient(90deg, #ff4202 0%, #ff8b61 100%); }
+      .snapshot-circ-note { margin: 8px 0 0; font-size: 12px; color: #666666; }
+      .snapshot-footnote { margin: 12px 0 0; font-size: 12px; color: #7a7a7a; }
+      .tldr { background: #fff8ec; border-top: 2px solid #ff4202; }
+      .conclusion { background: #fff7f3; border-top: 2px solid #ff4202; }
+      .footer { padding: 18px 32px 28px; font-size: 12px; color: #7a7a7a; }
+      .footer p { margin: 0; }
+      .footer p + p { margin-top: 6px; }
+      .footer-links { margin-top: 14px; padding-top: 12px; border-top: 1px solid #ececec; display: grid; grid-template-columns: 1fr 1fr; gap: 10px; }
+      .footer-panel { border: 1px solid #ececec; border-radius: 12px; background: #fafafa; padding: 10px; }
+      .footer-panel-title { margin: 0 0 8px; font-size: 11px; font-weight: 700; letter-spacing: 0.6px; text-transform: uppercase; color: #8a8a8a; font-family: "Poppins", Arial, sans-serif; }
+      .footer-logo-link { display: inline-flex; align-items: center; gap: 8px; color: #1f1f1f; font-size: 12px; font-weight: 600; }
+      .footer-logo-link img { width: 52px; height: 52px; object-fit: cover; border-radius: 20px; border: 1px solid #e0e0e0; }
+      .footer-social { display: flex; flex-direction: column; gap: 6px; }
+      .footer-social a { display: inline-flex; align-items: center; gap: 8px; color: #1f1f1f; font-size: 12px; font-weight: 600; font-family: "Poppins", Arial, sans-serif; }
+      .footer-social img { width: 30px; height: 30px; object-fit: contain; border-radius: 8px; }
+      @media (max-width: 720px) {
+        .toolbar { padding: 10px 16px 6px; box-sizing: border-box; }
+        .wrapper { padding: 16px 0; }
+        .container { width: 100%; max-width: 100%; border-radius: 0; }
+        .header, .section, .footer { padding: 18px 20px; }
+        .snapshot-grid { grid-template-columns: 1fr; }
+        .footer-links { grid-template-columns: 1fr; }
+        h1 { font-size: 24px; }
+      }
+      @media print {
+        .no-print { display: none !important; }
+        body { background: #ffffff; }
+        .wrapper { background: #ffffff; padding: 0; }
+        .container { border: 0; border-radius: 0; }
+      }
+"""
+
+CSS_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.S)
+CSS_SPACING_PATTERN = re.compile(r"\s*([{}:;,>+])\s*")
+NEWSLETTER_CSS_MINIFIED = CSS_SPACING_PATTERN.sub(
+    r"\1", CSS_COMMENT_PATTERN.sub("", NEWSLETTER_CSS)
+).replace(";}", "}").strip()
+
+PAGE_HEAD_STATIC_HTML = f"""    <style>
+      {NEWSLETTER_CSS_MINIFIED}
+    </style>
+  </head>
+  <body>
+    <div class="toolbar no-print">
+      <button class="download-pdf-btn" type="button" onclick="window.print()">Download PDF</button>
+    </div>
+    <table class="wrapper" role="presentation" width="100%" cellpadding="0" cellspacing="0">
+      <tr>
+        <td align="center">
+          <table class="container" role="presentation" cellpadding="0" cellspacing="0">
+            <tr>
+              <td class="divider">&nbsp;</td>
+            </tr>
+            <tr>
+              <td class="header">
+                <div class="logo">
+                  <img src="brand_orange_bg_transparent@2xSite.svg" alt="Globalite">
+                </div>
+"""
+PAGE_SCRIPT_HTML = """    <script>
+      (function () {
+        var params = new URLSearchParams(window.location.search);
+        var refreshSeconds = Number(params.get("refresh"));
+        if (!Number.isFinite(refreshSeconds) || refreshSeconds < 5) {
+          return;
+        }
+        window.setInterval(function () {
+          window.location.reload();
+        }, refreshSeconds * 1000);
+      })();
+    </script>
+  </body>
+</html>
+"""
+
 
 @dataclass
 class Point:
@@ -83,16 +236,30 @@ class Point:
     source: str
 
 
-@dataclass
-class DistributionSegment:
+class DistributionSegment(NamedTuple):
     category: str
     amount_btc: float
     percent: float
     color: str
 
 
+@dataclass(frozen=True)
+class ImageSettings:
+    output_dir: Path
+    auto_by_order: bool
+    image_prefix: str
+    max_extra_images: int
+    names: dict[str, str]
+
+
+DEFAULT_DISTRIBUTION_SEGMENTS = tuple(
+    DistributionSegment(category=category, amount_btc=float(amount), percent=0.0, color=color)
+    for category, amount, color in DEFAULT_DISTRIBUTION
+)
+
+
 class TabularSheet:
-    """Small adapter that exposes CSV rows like an openpyxl worksheet."""
+    """Small adapter that exposes plain rows like an openpyxl worksheet."""
 
     def __init__(self, rows: list[list[str]]) -> None:
         self.rows = rows
@@ -113,6 +280,8 @@ class TabularSheet:
 def normalize_text(value: object) -> str:
     if value is None:
         return ""
+    if type(value) is str:
+        return value.strip()
     return str(value).strip()
 
 
@@ -176,25 +345,94 @@ def extract_google_sheet_id(sheet_ref: str) -> str:
 def normalize_table_rows(rows: list[list[str]]) -> list[list[str]]:
     if not rows:
         return []
-    width = max(len(row) for row in rows)
+    widths = [len(row) for row in rows]
+    width = max(widths)
+    if min(widths) == width:
+        return rows
     return [row + [""] * (width - len(row)) for row in rows]
 
 
-def next_history_workbook_path(history_dir: Path) -> Path:
+def next_history_workbook_path(history_dir: Path, digest: str) -> Path:
     timestamp = datetime.now().strftime("%Y-%m-%d_%H%M")
-    backup_path = history_dir / f"newsletter_{timestamp}.xlsx"
-    if backup_path.exists():
+    backup_path = history_dir / f"newsletter_{timestamp}_{digest}.xlsx"
+    if backup_path.exists() or backup_path.is_symlink():
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
-        backup_path = history_dir / f"newsletter_{timestamp}.xlsx"
+        backup_path = history_dir / f"newsletter_{timestamp}_{digest}.xlsx"
     return backup_path
 
 
+def latest_history_snapshot(history_dir: Path) -> tuple[Path, str] | None:
+    latest: tuple[Path, str] | None = None
+    latest_key: tuple[str, str, str] | None = None
+    for path in history_dir.iterdir():
+        match = HISTORY_SNAPSHOT_PATTERN.fullmatch(path.name)
+        if not match:
+            continue
+        # Names mix HHMM and HHMMSS stamps, so compare the parsed parts
+        # rather than the raw filenames.
+        key = (match.group(1), match.group(2), match.group(3) or "")
+        if latest_key is None or key > latest_key:
+            latest_key = key
+            latest = (path, match.group(4) or "")
+    return latest
+
+
+def link_unchanged_snapshot(
+    history_dir: Path, digest: str
+) -> tuple[Path, str] | None:
+    latest = latest_history_snapshot(history_dir)
+    if latest is None or latest[1] != digest:
+        return None
+    target = latest[0].resolve()
+    if not target.exists():
+        return None
+    link_path = next_history_workbook_path(history_dir, digest)
+    try:
+        os.symlink(target.name, link_path)
+    except OSError:
+        return target, "unchanged"
+    return link_path, "linked"
+
+
+def save_history_snapshot(
+    history_dir: Path, digest: str, write_snapshot: Callable[[Path], None]
+) -> tuple[Path, str]:
+    history_dir.mkdir(exist_ok=True)
+    linked = link_unchanged_snapshot(history_dir, digest)
+    if linked is not None:
+        return linked
+    backup_path = next_history_workbook_path(history_dir, digest)
+    write_snapshot(backup_path)
+    return backup_path, "saved"
+
+
+def copy_workbook_snapshot(source: Path, destination: Path) -> None:
+    # Hard links are deliberately not used: the source workbook is often
+    # rewritten in place (e.g. --init-template --force), which would silently
+    # change every snapshot sharing its inode. A copy-on-write clone is safe.
+    if sys.platform.startswith("linux"):
+        import fcntl
+
+        # fcntl only exposes FICLONE from Python 3.12 on.
+        ficlone = getattr(fcntl, "FICLONE", 0x40049409)
+        try:
+            with source.open("rb") as src, destination.open("wb") as dst:
+                fcntl.ioctl(dst.fileno(), ficlone, src.fileno())
+            shutil.copystat(source, destination)
+            return
+        except OSError:
+            pass  # Filesystem without reflinks; fall back to a regular copy.
+    shutil.copy2(source, destination)
+
+
 def write_google_snapshot_workbook(
     path: Path,
     meta_rows: list[list[str]],
     points_rows: list[list[str]],
     distribution_rows: list[list[str]],
 ) -> None:
+    from openpyxl import Workbook
+
     workbook = Workbook()
     meta_sheet = workbook.active
     meta_sheet.title = "meta"
@@ -213,46 +451,87 @@ def write_google_snapshot_workbook(
     workbook.save(path)
 
 
-def fetch_google_sheet_rows(
-    sheet_id: str,
-    tab_name: str,
-    required: bool = True,
-) -> list[list[str]]:
-    safe_tab = quote(normalize_text(tab_name), safe="")
-    url = (
-        f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?"
-        f"tqx=out:csv&sheet={safe_tab}"
-    )
+def google_sheet_cache_paths(sheet_id: str, tab_name: str) -> tuple[Path, Path]:
+    cache_dir = GOOGLE_SHEET_CACHE_DIR / sheet_id
+    safe_tab = quote(tab_name, safe="")
+    return cache_dir / f"{safe_tab}.csv", cache_dir / f"{safe_tab}.meta.json"
+
+
+def read_google_sheet_cache(
+    csv_path: Path, meta_path: Path
+) -> tuple[list[list[str]], dict]:
     try:
-        with urlopen(url, timeout=30) as response:
-            payload = response.read().decode("utf-8-sig")
-    except HTTPError as error:
-        if not required and error.code in {400, 404}:
-            return []
-        raise RuntimeError(
-            f"Could not load Google Sheet tab '{tab_name}' (HTTP {error.code}). "
-            "Confirm sharing is enabled and tab names are correct."
-        ) from error
-    except URLError as error:
-        raise RuntimeError(
-            f"Network error while loading Google Sheet tab '{tab_name}': {error.reason}"
-        ) from error
+        cache_meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        with csv_path.open(encoding="utf-8", newline="") as handle:
+            rows = list(csv.reader(handle))
+    except (OSError, ValueError, csv.Error):
+        return [], {}
+    if not isinstance(cache_meta, dict):
+        return [], {}
+    fetched = cache_meta.get("fetched")
+    if type(fetched) not in (int, float) or not math.isfinite(fetched):
+        return [], {}
+    if any(
+        cache_meta.get(key) is not None and not isinstance(cache_meta[key], str)
+        for key in ("etag", "last_modified")
+    ):
+        return [], {}
+    return rows, cache_meta
 
-    text = payload.strip()
-    if not text:
+
+def write_google_sheet_cache(
+    csv_path: Path, meta_path: Path, rows: list[list[str]] | None, cache_meta: dict
+) -> None:
+    partial_csv_path = csv_path.with_name(f".{csv_path.name}.{os.getpid()}.partial")
+    partial_meta_path = meta_path.with_name(f".{meta_path.name}.{os.getpid()}.partial")
+    # The cache only saves network round-trips; a failed write must not fail the build.
+    try:
+        csv_path.parent.mkdir(parents=True, exist_ok=True)
+        if rows is not None:
+            with partial_csv_path.open("w", encoding="utf-8", newline="") as handle:
+                csv.writer(handle).writerows(rows)
+            os.replace(partial_csv_path, csv_path)
+        partial_meta_path.write_text(json.dumps(cache_meta), encoding="utf-8")
+        os.replace(partial_meta_path, meta_path)
+    except OSError:
+        pass
+    finally:
+        partial_csv_path.unlink(missing_ok=True)
+        partial_meta_path.unlink(missing_ok=True)
+
+
+def response_body(response) -> BinaryIO:
+    if response.headers.get("Content-Encoding", "").lower() == "gzip":
+        return gzip.GzipFile(fileobj=response)
+    return response
+
+
+def parse_google_sheet_csv(
+    lines: Iterable[str], tab_name: str, required: bool, content_type: str = ""
+) -> list[list[str]]:
+    lines = iter(lines)
+    first_line = next(lines, "")
+    while first_line and not first_line.strip():
+        first_line = next(lines, "")
+    if not first_line:
         if required:
             raise ValueError(f"Google Sheet tab '{tab_name}' is empty.")
         return []
 
-    lowered = text.lower()
-    if lowered.startswith("<!doctype html") or lowered.startswith("<html"):
+    lowered = "" if content_type == "text/csv" else first_line.lstrip().lower()
+    if (
+        content_type == "text/html"
+        or lowered.startswith("<!doctype html")
+        or lowered.startswith("<html")
+    ):
         if not required:
             return []
         raise RuntimeError(
             f"Could not read Google Sheet tab '{tab_name}'. "
             "Share the sheet as viewable (at least 'Anyone with the link can view')."
         )
-    if "google.visualization.query.setresponse" in lowered and "status\":\"error\"" in lowered:
+    if lowered.startswith("/*o_o*/") or lowered.startswith("google.visualization"):
+        # A CSV export only answers with the gviz JavaScript envelope on errors.
         if not required:
             return []
         raise RuntimeError(
@@ -260,7 +539,9 @@ def fetch_google_sheet_rows(
             "Check that the tab exists and has access permissions."
         )
 
-    rows = normalize_table_rows(list(csv.reader(StringIO(text))))
+    rows = normalize_table_rows(list(csv.reader(chain([first_line], lines))))
+    while rows and not any(rows[-1]):
+        rows.pop()
     if not rows:
         if required:
             raise ValueError(f"Google Sheet tab '{tab_name}' is empty.")
@@ -268,10 +549,240 @@ def fetch_google_sheet_rows(
     return rows
 
 
+@functools.lru_cache(maxsize=None)
+def _load_google_sheet_rows(
+    sheet_id: str,
+    tab_name: str,
+    required: bool,
+    cache_ttl: float,
+) -> list[list[str]]:
+    from urllib.error import HTTPError, URLError
+    from urllib.request import Request, urlopen
+
+    csv_path, meta_path = google_sheet_cache_paths(sheet_id, tab_name)
+    cached_rows, cache_meta = read_google_sheet_cache(csv_path, meta_path)
+    if cached_rows and time.time() - cache_meta["fetched"] < cache_ttl:
+        return cached_rows
+
+    safe_tab = quote(tab_name, safe="")
+    url = (
+        f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?"
+        f"tqx=out:csv&sheet={safe_tab}"
+    )
+    headers = {"Accept-Encoding": "gzip"}
+    if cached_rows:
+        if cache_meta.get("etag"):
+            headers["If-None-Match"] = cache_meta["etag"]
+        if cache_meta.get("last_modified"):
+            headers["If-Modified-Since"] = cache_meta["last_modified"]
+    try:
+        with urlopen(Request(url, headers=headers), timeout=30) as response:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            rows = parse_google_sheet_csv(
+                TextIOWrapper(
+                    response_body(response), encoding="utf-8-sig", newline=""
+                ),
+                tab_name,
+                required,
+                content_type=response.headers.get_content_type(),
+            )
+    except HTTPError as error:
+        if error.code == 304 and cached_rows:
+            cache_meta["fetched"] = time.time()
+            write_google_sheet_cache(csv_path, meta_path, None, cache_meta)
+            return cached_rows
+        if not required and error.code in {400, 404}:
+            return []
+        raise RuntimeError(
+            f"Could not load Google Sheet tab '{tab_name}' (HTTP {error.code}). "
+            "Confirm sharing is enabled and tab names are correct."
+        ) from error
+    except URLError as error:
+        raise RuntimeError(
+            f"Network error while loading Google Sheet tab '{tab_name}': {error.reason}"
+        ) from error
+
+    if rows:
+        write_google_sheet_cache(
+            csv_path,
+            meta_path,
+            rows,
+            {"etag": etag, "last_modified": last_modified, "fetched": time.time()},
+        )
+    return rows
+
+
+def fetch_google_sheet_rows(
+    sheet_id: str,
+    tab_name: str,
+    required: bool = True,
+    cache_ttl: float = DEFAULT_CACHE_TTL_SECONDS,
+) -> list[list[str]]:
+    rows = _load_google_sheet_rows(
+        sheet_id, normalize_text(tab_name), required, max(0.0, cache_ttl)
+    )
+    # Callers get their own lists so the memoized rows stay untouched.
+    return [list(row) for row in rows]
+
+
+def parse_json_bytes(data: bytes) -> dict:
+    # orjson is optional; it parses large value grids a little faster.
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def google_api_error_message(error) -> str:
+    try:
+        payload = parse_json_bytes(error.read())
+        return normalize_text(payload["error"]["message"])
+    except (AttributeError, OSError, ValueError, KeyError, TypeError):
+        return ""
+
+
+def fetch_google_sheet_rows_batch(
+    sheet_id: str,
+    tabs: dict[str, tuple[str, bool]],
+    api_key: str,
+    cache_ttl: float = DEFAULT_CACHE_TTL_SECONDS,
+) -> dict[str, list[list[str]]]:
+    from urllib.error import HTTPError, URLError
+    from urllib.request import Request, urlopen
+
+    tab_names = {key: normalize_text(tab_name) for key, (tab_name, _) in tabs.items()}
+    cache_paths = {
+        key: google_sheet_cache_paths(sheet_id, tab_name)
+        for key, tab_name in tab_names.items()
+    }
+    cached = {key: read_google_sheet_cache(*paths) for key, paths in cache_paths.items()}
+    now = time.time()
+    if all(
+        (rows or not tabs[key][1])
+        and now - cache_meta.get("fetched", 0) < max(0.0, cache_ttl)
+        for key, (rows, cache_meta) in cached.items()
+    ):
+        return {key: [list(row) for row in rows] for key, (rows, _) in cached.items()}
+
+    range_names = {
+        key: "'" + tab_name.replace("'", "''") + "'" for key, tab_name in tab_names.items()
+    }
+    # Optional tabs recently found missing are left out until the TTL expires,
+    # so a sheet without them still costs a single request.
+    known_missing = {
+        key
+        for key, (_, cache_meta) in cached.items()
+        if cache_meta.get("missing") and now - cache_meta["fetched"] < max(0.0, cache_ttl)
+    }
+    missing = set(known_missing)
+    while True:
+        requested = [key for key in tabs if key not in missing]
+        ranges = "&".join(
+            "ranges=" + quote(range_names[key], safe="") for key in requested
+        )
+        url = (
+            f"https://sheets.googleapis.com/v4/spreadsheets/{sheet_id}/values:batchGet?"
+            f"{ranges}&key={quote(api_key, safe='')}"
+        )
+        try:
+            request = Request(url, headers={"Accept-Encoding": "gzip"})
+            with urlopen(request, timeout=30) as response:
+                body = response_body(response).read()
+            break
+        except HTTPError as error:
+            message = google_api_error_message(error)
+            # One missing range fails the whole batch; retry without it only
+            # when the API names an optional tab as the range it cannot parse.
+            unparsed_range = ""
+            if error.code == 400 and message.startswith("Unable to parse range:"):
+                unparsed_range = message.split(":", 1)[1].strip()
+            unparsed_key = next(
+                (
+                    key
+                    for key in requested
+                    if unparsed_range in (range_names[key], tab_names[key])
+                ),
+                None,
+            )
+            if unparsed_key is not None and not tabs[unparsed_key][1]:
+                missing.add(unparsed_key)
+                continue
+            if unparsed_key is not None:
+                raise RuntimeError(
+                    f"Google Sheet tab '{tab_names[unparsed_key]}' was not found. "
+                    "Confirm the tab names."
+                ) from error
+            detail = f": {message.rstrip('.')}" if message else ""
+            raise RuntimeError(
+                f"Could not load Google Sheet tabs via the Sheets API (HTTP {error.code}){detail}. "
+                "Confirm the API key, sharing settings, and tab names."
+            ) from error
+        except URLError as error:
+            raise RuntimeError(
+                f"Network error while loading Google Sheet tabs: {error.reason}"
+            ) from error
+
+    payload = parse_json_bytes(body)
+    value_ranges = dict(zip(requested, payload.get("valueRanges", [])))
+    fetched = time.time()
+    result: dict[str, list[list[str]]] = {}
+    for key, (_, required) in tabs.items():
+        if key in missing:
+            if key not in known_missing:
+                write_google_sheet_cache(
+                    *cache_paths[key], [], {"fetched": fetched, "missing": True}
+                )
+            result[key] = []
+            continue
+        values = value_ranges.get(key, {}).get("values", [])
+        rows = normalize_table_rows(
+            [[normalize_text(cell) for cell in row] for row in values]
+        )
+        while rows and not any(rows[-1]):
+            rows.pop()
+        if not rows and required:
+            raise ValueError(f"Google Sheet tab '{tab_names[key]}' is empty.")
+        write_google_sheet_cache(*cache_paths[key], rows, {"fetched": fetched})
+        result[key] = rows
+    return result
+
+
+def fetch_all_google_tabs(
+    sheet_id: str,
+    meta_tab: str,
+    points_tab: str,
+    distribution_tab: str,
+    cache_ttl: float = DEFAULT_CACHE_TTL_SECONDS,
+    api_key: str = "",
+) -> dict[str, list[list[str]]]:
+    from concurrent.futures import ThreadPoolExecutor
+
+    tabs = {
+        "meta": (meta_tab, True),
+        "points": (points_tab, True),
+        "distribution": (distribution_tab, False),
+    }
+    if api_key:
+        return fetch_google_sheet_rows_batch(sheet_id, tabs, api_key, cache_ttl)
+
+    with ThreadPoolExecutor(max_workers=len(tabs)) as executor:
+        futures = {
+            key: executor.submit(
+                fetch_google_sheet_rows, sheet_id, tab_name, required, cache_ttl
+            )
+            for key, (tab_name, required) in tabs.items()
+        }
+        return {key: future.result() for key, future in futures.items()}
+
+
 def create_template_workbook(path: Path, force: bool = False) -> None:
     if path.exists() and not force:
         raise FileExistsError(f"Template already exists at: {path}")
 
+    from openpyxl import Workbook
+
     wb = Workbook()
     meta = wb.active
     meta.title = "meta"
@@ -313,47 +824,50 @@ def create_template_workbook(path: Path, force: bool = False) -> None:
 
 
 def read_meta(meta_sheet) -> dict[str, str]:
-    meta: dict[str, str] = {}
+    meta = dict(DEFAULT_META)
     for row in meta_sheet.iter_rows(min_row=2, values_only=True):
         key = normalize_text(row[0] if len(row) > 0 else "")
         value = normalize_text(row[1] if len(row) > 1 else "")
         if key:
             meta[key] = value
-    for key, value in DEFAULT_META.items():
-        meta.setdefault(key, value)
     return meta
 
 
-def header_index_map(points_sheet) -> dict[str, int]:
-    headers = list(points_sheet.iter_rows(min_row=1, max_row=1, values_only=True))[0]
+def row_value(row: tuple, index: int) -> object:
+    return row[index] if index < len(row) else None
+
+
+def header_index_map(
+    sheet, required: tuple[str, ...], sheet_name: str
+) -> dict[str, int]:
+    headers = next(sheet.iter_rows(min_row=1, max_row=1, values_only=True), ())
     mapping: dict[str, int] = {}
     for index, header in enumerate(headers):
         key = normalize_text(header).lower()
         if key:
             mapping[key] = index
-    required = ["order", "title", "content", "image_path", "image_caption"]
     missing = [name for name in required if name not in mapping]
     if missing:
         raise ValueError(
-            "Missing required columns in points sheet: " + ", ".join(missing)
+            f"Missing required columns in {sheet_name} sheet: " + ", ".join(missing)
         )
     return mapping
 
 
 def read_points(points_sheet) -> list[Point]:
-    mapping = header_index_map(points_sheet)
+    mapping = header_index_map(points_sheet, POINTS_REQUIRED_COLUMNS, "points")
     points: list[Point] = []
 
     for row_number, row in enumerate(
         points_sheet.iter_rows(min_row=2, values_only=True), start=2
     ):
-        order_text = normalize_text(row[mapping["order"]])
-        title = normalize_text(row[mapping["title"]])
-        content = normalize_text(row[mapping["content"]])
-        image_path = normalize_text(row[mapping["image_path"]])
-        image_caption = normalize_text(row[mapping["image_caption"]])
+        order_text = normalize_text(row_value(row, mapping["order"]))
+        title = normalize_text(row_value(row, mapping["title"]))
+        content = normalize_text(row_value(row, mapping["content"]))
+        image_path = normalize_text(row_value(row, mapping["image_path"]))
+        image_caption = normalize_text(row_value(row, mapping["image_caption"]))
         source = (
-            normalize_text(row[mapping["source"]])
+            normalize_text(row_value(row, mapping["source"]))
             if "source" in mapping
             else ""
         )
@@ -382,8 +896,8 @@ def read_points(points_sheet) -> list[Point]:
         raise ValueError("No points found. Add at least 1 row in the points sheet.")
 
     points.sort(key=lambda item: item.order)
-    orders = [item.order for item in points]
-    duplicates = sorted({order for order in orders if orders.count(order) > 1})
+    order_counts = Counter(item.order for item in points)
+    duplicates = sorted(order for order, count in order_counts.items() if count > 1)
     if duplicates:
         raise ValueError(
             "Duplicate order values found: " + ", ".join(str(value) for value in duplicates)
@@ -398,16 +912,7 @@ def read_points(points_sheet) -> list[Point]:
 
 
 def default_distribution_segments(max_supply_btc: float) -> list[DistributionSegment]:
-    base = [
-        DistributionSegment(
-            category=category,
-            amount_btc=float(amount),
-            percent=0.0,
-            color=color,
-        )
-        for category, amount, color in DEFAULT_DISTRIBUTION
-    ]
-    return finalize_distribution_segments(base, max_supply_btc)
+    return finalize_distribution_segments(list(DEFAULT_DISTRIBUTION_SEGMENTS), max_supply_btc)
 
 
 def finalize_distribution_segments(
@@ -418,26 +923,17 @@ def finalize_distribution_segments(
     denominator = max_supply_btc if max_supply_btc > 0 else sum(s.amount_btc for s in segments)
     if denominator <= 0:
         denominator = 1.0
-    normalized = [
-        DistributionSegment(
-            category=s.category,
-            amount_btc=s.amount_btc,
-            percent=s.percent if s.percent > 0 else (s.amount_btc / denominator) * 100,
-            color=s.color,
-        )
+    percents = [
+        s.percent if s.percent > 0 else (s.amount_btc / denominator) * 100
         for s in segments
     ]
-    total_percent = sum(s.percent for s in normalized)
+    total_percent = sum(percents)
     if total_percent > 0:
-        normalized = [
-            DistributionSegment(
-                category=s.category,
-                amount_btc=s.amount_btc,
-                percent=(s.percent / total_percent) * 100,
-                color=s.color,
-            )
-            for s in normalized
-        ]
+        percents = [(percent / total_percent) * 100 for percent in percents]
+    normalized = [
+        segment._replace(percent=percent)
+        for segment, percent in zip(segments, percents)
+    ]
     normalized.sort(key=lambda item: item.amount_btc, reverse=True)
     return normalized
 
@@ -445,25 +941,20 @@ def finalize_distribution_segments(
 def read_distribution(
     distribution_sheet, max_supply_btc: float
 ) -> list[DistributionSegment]:
-    headers = list(distribution_sheet.iter_rows(min_row=1, max_row=1, values_only=True))[0]
-    mapping: dict[str, int] = {}
-    for index, header in enumerate(headers):
-        key = normalize_text(header).lower()
-        if key:
-            mapping[key] = index
-    required = ["category", "amount_btc", "color"]
-    missing = [name for name in required if name not in mapping]
-    if missing:
-        raise ValueError(
-            "Missing required columns in distribution sheet: " + ", ".join(missing)
-        )
+    mapping = header_index_map(
+        distribution_sheet, DISTRIBUTION_REQUIRED_COLUMNS, "distribution"
+    )
 
     segments: list[DistributionSegment] = []
     for row in distribution_sheet.iter_rows(min_row=2, values_only=True):
-        category = normalize_text(row[mapping["category"]])
-        amount_btc = parse_number(row[mapping["amount_btc"]], default=0.0)
-        color = normalize_text(row[mapping["color"]]) or "rgb(255, 66, 2)"
-        percent = parse_number(row[mapping["percent"]], default=0.0) if "percent" in mapping else 0.0
+        category = normalize_text(row_value(row, mapping["category"]))
+        amount_btc = parse_number(row_value(row, mapping["amount_btc"]), default=0.0)
+        color = normalize_text(row_value(row, mapping["color"])) or "rgb(255, 66, 2)"
+        percent = (
+            parse_number(row_value(row, mapping["percent"]), default=0.0)
+            if "percent" in mapping
+            else 0.0
+        )
         if not category and amount_btc <= 0:
             continue
         if not category:
@@ -484,65 +975,152 @@ def read_distribution(
     return finalize_distribution_segments(segments, max_supply_btc)
 
 
-def render_content_blocks(raw: str) -> str:
-    lines = raw.replace("\r\n", "\n").split("\n")
-    blocks: list[str] = []
-    list_open = False
+def calamine_cell_value(value: object) -> object:
+    # Match what openpyxl hands back: calamine reports every number as float
+    # and plain dates as date. Error cells (#N/A, #DIV/0!, ...) cannot be
+    # mapped back, since calamine already returns them as empty strings.
+    if type(value) is float and value.is_integer():
+        return int(value)
+    if type(value) is date:
+        return datetime.combine(value, datetime.min.time())
+    return value
+
+
+def parse_workbook_sheets(
+    sheets,
+) -> tuple[dict[str, str], list[Point], list[DistributionSegment]]:
+    if "meta" not in sheets:
+        raise ValueError("Workbook is missing required sheet: meta")
+    if "points" not in sheets:
+        raise ValueError("Workbook is missing required sheet: points")
+
+    meta = read_meta(sheets["meta"])
+    points = read_points(sheets["points"])
+    max_supply_btc = parse_number(meta["max_supply_btc"], default=21_000_000)
+    if "distribution" in sheets:
+        distribution = read_distribution(sheets["distribution"], max_supply_btc)
+    else:
+        distribution = default_distribution_segments(max_supply_btc)
+    return meta, points, distribution
+
+
+def read_workbook(
+    xlsx_path: Path,
+) -> tuple[dict[str, str], list[Point], list[DistributionSegment]]:
+    # python-calamine is optional. openpyxl is only imported when neither it
+    # nor the workbook cache can be used, so cached builds never load it.
+    try:
+        from python_calamine import CalamineWorkbook
+    except ImportError:
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(xlsx_path, read_only=True, data_only=True)
+        try:
+            # Read-only sheets otherwise stop at their declared <dimension>,
+            # which is optional and can be stale.
+            for worksheet in workbook.worksheets:
+                worksheet.reset_dimensions()
+            return parse_workbook_sheets(workbook)
+        finally:
+            # Read-only workbooks keep the archive open until closed.
+            workbook.close()
+
+    with CalamineWorkbook.from_path(str(xlsx_path)) as workbook:
+        sheets = {
+            name: TabularSheet(
+                [
+                    [calamine_cell_value(value) for value in row]
+                    for row in workbook.get_sheet_by_name(name).to_python(
+                        skip_empty_area=False
+                    )
+                ]
+            )
+            for name in ("meta", "points", "distribution")
+            if name in workbook.sheet_names
+        }
+    return parse_workbook_sheets(sheets)
+
+
+def read_workbook_cached(
+    xlsx_path: Path,
+) -> tuple[dict[str, str], list[Point], list[DistributionSegment]]:
+    workbook_stat = xlsx_path.stat()
+    script_stat = SCRIPT_PATH.stat()
+    # The script's own mtime is part of the key so parser changes invalidate old entries.
+    signature = (
+        str(xlsx_path),
+        workbook_stat.st_mtime_ns,
+        workbook_stat.st_size,
+        script_stat.st_mtime_ns,
+    )
+    cache_name = hashlib.sha1(str(xlsx_path).encode("utf-8")).hexdigest()
+    cache_path = WORKBOOK_CACHE_DIR / f"{cache_name}.pkl"
+    try:
+        with cache_path.open("rb") as handle:
+            cached_signature, parsed = pickle.load(handle)
+        if cached_signature == signature:
+            return parsed
+    except Exception:
+        # Any unreadable entry is just a cache miss; it is rewritten below.
+        pass
+
+    parsed = read_workbook(xlsx_path)
+    partial_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.partial")
+    try:
+        WORKBOOK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with partial_path.open("wb") as handle:
+            pickle.dump((signature, parsed), handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(partial_path, cache_path)
+    except OSError:
+        pass
+    finally:
+        partial_path.unlink(missing_ok=True)
+    return parsed
 
-    def close_list() -> None:
-        nonlocal list_open
-        if list_open:
-            blocks.append("</ul>")
-            list_open = False
 
-    for original_line in lines:
+def render_content_blocks(raw: str, out: TextIO, indent: str = "") -> None:
+    list_open = False
+    for original_line in LINE_BREAK_PATTERN.split(raw):
         line = original_line.strip()
         if not line:
-            close_list()
-            continue
-
-        if line.startswith("- ") or line.startswith("* "):
-            item = emphasize_numbers(line[2:].strip())
+            if list_open:
+                out.write(f"{indent}</ul>\n")
+                list_open = False
+        elif line[:2] in ("- ", "* "):
             if not list_open:
-                blocks.append("<ul>")
+                out.write(f"{indent}<ul>\n")
                 list_open = True
-            blocks.append(f"<li>{item}</li>")
+            out.write(f"{indent}<li>{emphasize_numbers(line[2:].strip())}</li>\n")
         else:
-            close_list()
-            blocks.append(f"<p>{emphasize_numbers(line)}</p>")
-
-    close_list()
-    return "\n".join(blocks)
+            if list_open:
+                out.write(f"{indent}</ul>\n")
+                list_open = False
+            out.write(f"{indent}<p>{emphasize_numbers(line)}</p>\n")
+    if list_open:
+        out.write(f"{indent}</ul>\n")
 
 
 def emphasize_numbers(text: str) -> str:
-    output: list[str] = []
-    start = 0
-    for match in NUMBER_PATTERN.finditer(text):
-        output.append(html.escape(text[start : match.start()]))
-        output.append(f"<strong>{html.escape(match.group(0))}</strong>")
-        start = match.end()
-    output.append(html.escape(text[start:]))
-    return "".join(output)
+    # Escaping never adds a standalone number, so matching after escaping
+    # finds the same spans as matching the raw text.
+    return NUMBER_PATTERN.sub(r"<strong>\g<0></strong>", html.escape(text))
 
 
 def format_btc_integer(value: float) -> str:
-    return f"{int(round(value)):,}"
+    return format(round(value), ",")
 
 
 def format_btc_compact(value: float) -> str:
     abs_value = abs(value)
     if abs_value >= 1_000_000:
-        rendered = f"{value / 1_000_000:.2f}".rstrip("0").rstrip(".")
-        return f"{rendered}M BTC"
+        return format(value / 1_000_000, ".2f").rstrip("0").rstrip(".") + "M BTC"
     if abs_value >= 1_000:
-        rendered = f"{int(round(value / 1_000)):,}"
-        return f"{rendered}K BTC"
-    return f"{format_btc_integer(value)} BTC"
+        return format(round(value / 1_000), ",") + "K BTC"
+    return format(round(value), ",") + " BTC"
 
 
 def format_percent(value: float) -> str:
-    return f"{value:.1f}".rstrip("0").rstrip(".") + "%"
+    return format(value, ".1f").rstrip("0").rstrip(".") + "%"
 
 
 def render_block_height(value: str) -> str:
@@ -551,13 +1129,13 @@ def render_block_height(value: str) -> str:
         return "n/a"
     numeric = parse_number(clean, default=-1)
     if numeric >= 0:
-        return f"{int(round(numeric)):,}"
+        return format_btc_integer(numeric)
     return clean
 
 
 def render_snapshot_section(
-    meta: dict[str, str], distribution: list[DistributionSegment]
-) -> str:
+    meta: dict[str, str], distribution: list[DistributionSegment], out: TextIO
+) -> None:
     snapshot_title = normalize_text(meta.get("snapshot_title", "")) or "At The Time Of Writing"
     snapshot_intro = normalize_text(meta.get("snapshot_intro", ""))
     snapshot_note = normalize_text(meta.get("snapshot_note", ""))
@@ -581,38 +1159,18 @@ def render_snapshot_section(
     if hashrate_scale_eh_s <= 0:
         hashrate_scale_eh_s = 1000.0
     hashrate_pct = (hashrate_eh_s / hashrate_scale_eh_s) * 100 if hashrate_scale_eh_s > 0 else 0
-
-    bar_segments = "\n".join(
-        f'                    <div class="snapshot-bar-segment" style="width:{max(0.0, seg.percent):.6f}%;background:{html.escape(seg.color)};" title="{html.escape(seg.category)}: {html.escape(format_btc_compact(seg.amount_btc))} ({html.escape(format_percent(seg.percent))})"></div>'
-        for seg in distribution
-    )
-    circumference = 2 * math.pi * 45
-    consumed = 0.0
-    donut_segments: list[str] = []
-    for seg in distribution:
-        arc = circumference * (max(0.0, seg.percent) / 100.0)
-        donut_segments.append(
-            (
-                f'                      <circle class="snapshot-donut-segment" cx="60" cy="60" r="45" '
-                f'stroke="{html.escape(seg.color)}" stroke-dasharray="{arc:.6f} {circumference:.6f}" '
-                f'stroke-dashoffset="{-consumed:.6f}">'
-                f'<title>{html.escape(seg.category)}: {html.escape(format_btc_compact(seg.amount_btc))} ({html.escape(format_percent(seg.percent))})</title>'
-                "</circle>"
-            )
-        )
-        consumed += arc
-    donut_svg = "\n".join(donut_segments)
-    legend_rows = "\n".join(
+    rendered_segments = [
         (
-            "                    <div class=\"snapshot-legend-item\">"
-            f"<span class=\"snapshot-dot\" style=\"background:{html.escape(seg.color)}\"></span>"
-            f"<span class=\"snapshot-name\">{html.escape(seg.category)}</span>"
-            f"<span class=\"snapshot-value\">{html.escape(format_btc_compact(seg.amount_btc))} ({html.escape(format_percent(seg.percent))})</span>"
-            "</div>"
+            html.escape(seg.color),
+            html.escape(seg.category),
+            f"{html.escape(format_btc_compact(seg.amount_btc))} ({html.escape(format_percent(seg.percent))})",
+            max(0.0, seg.percent),
         )
         for seg in distribution
-    )
-    return f"""
+    ]
+
+    out.write(
+        f"""
             <tr>
               <td class="section snapshot">
                 <h2>{html.escape(snapshot_title)}</h2>
@@ -623,18 +1181,48 @@ def render_snapshot_section(
                     <div class="snapshot-ownership-viz">
                       <svg class="snapshot-donut" viewBox="0 0 120 120" aria-label="Ownership distribution donut chart">
                         <circle cx="60" cy="60" r="45" fill="none" stroke="#ececec" stroke-width="24"></circle>
-{donut_svg}
-                        <circle cx="60" cy="60" r="30" fill="#ffffff"></circle>
+"""
+    )
+    circumference = 2 * math.pi * 45
+    arcs = [circumference * (width / 100.0) for _, _, _, width in rendered_segments]
+    for (color, category, value, _), arc, consumed in zip(
+        rendered_segments, arcs, accumulate(arcs, initial=0.0)
+    ):
+        out.write(
+            f'                      <circle class="snapshot-donut-segment" cx="60" cy="60" r="45" '
+            f'stroke="{color}" stroke-dasharray="{arc:.6f} {circumference:.6f}" '
+            f'stroke-dashoffset="{-consumed:.6f}">'
+            f'<title>{category}: {value}</title>'
+            "</circle>\n"
+        )
+    out.write(
+        f"""                        <circle cx="60" cy="60" r="30" fill="#ffffff"></circle>
                         <text x="60" y="56" text-anchor="middle" class="snapshot-donut-label">Supply</text>
                         <text x="60" y="72" text-anchor="middle" class="snapshot-donut-value">{html.escape(format_btc_integer(max_supply_btc))}</text>
                       </svg>
                     </div>
                     <div class="snapshot-bar">
-{bar_segments}
-                    </div>
+"""
+    )
+    for color, category, value, width in rendered_segments:
+        out.write(
+            f'                    <div class="snapshot-bar-segment" style="width:{width:.6f}%;background:{color};" title="{category}: {value}"></div>\n'
+        )
+    out.write(
+        """                    </div>
                     <div class="snapshot-legend">
-{legend_rows}
-                    </div>
+"""
+    )
+    for color, category, value, _ in rendered_segments:
+        out.write(
+            "                    <div class=\"snapshot-legend-item\">"
+            f"<span class=\"snapshot-dot\" style=\"background:{color}\"></span>"
+            f"<span class=\"snapshot-name\">{category}</span>"
+            f"<span class=\"snapshot-value\">{value}</span>"
+            "</div>\n"
+        )
+    out.write(
+        f"""                    </div>
                   </div>
                   <div class="snapshot-card">
                     <h3>Bitcoin In Circulation At Write Time</h3>
@@ -657,32 +1245,53 @@ def render_snapshot_section(
               </td>
             </tr>
 """
+    )
 
 
 def looks_like_remote_image_source(path: str) -> bool:
     return path.startswith(("http://", "https://", "data:", "cid:"))
 
 
-def resolve_image_path(point: Point, meta: dict[str, str], output_dir: Path) -> str:
+def list_image_dir(directory: Path) -> dict[str, str]:
+    # Keys are lowercased so lookups behave like exists() on case-insensitive
+    # filesystems; values keep the real name so the emitted src always resolves.
+    names: dict[str, str] = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                key = entry.name.lower()
+                if key not in names or entry.name == key:
+                    names[key] = entry.name
+    except OSError:
+        pass
+    return names
+
+
+def image_settings_from_meta(meta: dict[str, str], output_dir: Path) -> ImageSettings:
+    auto_by_order = parse_bool(meta.get("auto_image_by_order", "true"))
+    image_dir = normalize_text(meta.get("image_dir", ".")) or "."
+    max_extra_images = int(parse_number(meta.get("max_extra_images", "10"), default=10))
+    directory = Path(image_dir).as_posix()
+    image_prefix = "" if directory == "." else directory.rstrip("/") + "/"
+    return ImageSettings(
+        output_dir=output_dir,
+        auto_by_order=auto_by_order,
+        image_prefix=image_prefix,
+        max_extra_images=max(0, min(20, max_extra_images)),
+        names=list_image_dir(output_dir / image_dir) if auto_by_order else {},
+    )
+
+
+def resolve_image_path(point: Point, images: ImageSettings) -> str:
     image_path = normalize_text(point.image_path)
     if image_path:
         candidate = image_path
-    elif parse_bool(meta.get("auto_image_by_order", "true")):
-        image_dir = normalize_text(meta.get("image_dir", ".")) or "."
-        filename_candidates = [
-            f"{point.order}.png",
-            f"{point.order}.jpg",
-            f"{point.order}.jpeg",
-            f"{point.order}.webp",
-        ]
-        candidate = ""
-        for filename in filename_candidates:
-            relative_candidate = (Path(image_dir) / filename).as_posix()
-            if (output_dir / relative_candidate).exists():
-                candidate = relative_candidate
-                break
-        if not candidate:
-            return ""
+    elif images.auto_by_order:
+        for extension in ("png", "jpg", "jpeg", "webp"):
+            filename = images.names.get(f"{point.order}.{extension}")
+            if filename:
+                return f"{images.image_prefix}{filename}"
+        return ""
     else:
         return ""
 
@@ -693,281 +1302,164 @@ def resolve_image_path(point: Point, meta: dict[str, str], output_dir: Path) ->
     if candidate_path.is_absolute():
         return candidate if candidate_path.exists() else ""
 
-    return candidate if (output_dir / candidate).exists() else ""
+    return candidate if (images.output_dir / candidate).exists() else ""
 
 
-def resolve_extra_image_paths(
-    point: Point, meta: dict[str, str], output_dir: Path
-) -> list[str]:
-    if not parse_bool(meta.get("auto_image_by_order", "true")):
+def resolve_extra_image_paths(point: Point, images: ImageSettings) -> list[str]:
+    if not images.auto_by_order:
         return []
 
-    image_dir = normalize_text(meta.get("image_dir", ".")) or "."
-    max_extra_images = int(parse_number(meta.get("max_extra_images", "10"), default=10))
-    max_extra_images = max(0, min(20, max_extra_images))
     extensions = ["png", "jpg", "jpeg", "webp"]
     sources: list[str] = []
 
-    for index in range(1, max_extra_images + 1):
+    for index in range(1, images.max_extra_images + 1):
         for extension in extensions:
-            candidate = (Path(image_dir) / f"{point.order}.{index}.{extension}").as_posix()
-            if (output_dir / candidate).exists():
-                sources.append(candidate)
+            filename = images.names.get(f"{point.order}.{index}.{extension}")
+            if filename:
+                sources.append(f"{images.image_prefix}{filename}")
                 break
     return sources
 
 
-def render_image_block(point: Point, image_src: str) -> str:
+def render_image_block(point: Point, image_src: str, indent: str = "") -> str:
     if not image_src:
         return ""
     caption = point.image_caption or point.title
     return (
-        '<div class="image">\n'
-        f'  <img src="{html.escape(image_src)}" alt="{html.escape(point.title)}">\n'
-        f'  <div class="caption">{html.escape(caption)}</div>\n'
-        "</div>"
+        f'{indent}<div class="image">\n'
+        f'{indent}  <img src="{html.escape(image_src)}" alt="{html.escape(point.title)}">\n'
+        f'{indent}  <div class="caption">{html.escape(caption)}</div>\n'
+        f"{indent}</div>\n"
     )
 
 
-def render_extra_images_block(point: Point, image_sources: list[str]) -> str:
+def render_extra_images_block(
+    point: Point, image_sources: list[str], out: TextIO, indent: str = ""
+) -> None:
     if not image_sources:
-        return ""
-    image_tags = "\n".join(
-        f'  <img src="{html.escape(src)}" alt="{html.escape(point.title)} - extra {index}">'
+        return
+    alt = html.escape(point.title)
+    out.write(f'{indent}<div class="extra-images">\n')
+    out.writelines(
+        f'{indent}  <img src="{html.escape(src)}" alt="{alt} - extra {index}">\n'
         for index, src in enumerate(image_sources, start=1)
     )
-    return '<div class="extra-images">\n' + image_tags + "\n</div>"
+    out.write(f"{indent}</div>\n")
 
 
-def render_point(point: Point, meta: dict[str, str], output_dir: Path) -> str:
-    parts = [
-        "            <tr>",
-        '              <td class="section">',
-        f"                <h2>{point.order}. {html.escape(point.title)}</h2>",
-    ]
-
-    image_src = resolve_image_path(point, meta, output_dir)
-    image_block = render_image_block(point, image_src)
-    if image_block:
-        parts.append(indent_block(image_block, 16))
+def render_point(point: Point, images: ImageSettings, out: TextIO) -> None:
+    out.write(
+        "            <tr>\n"
+        '              <td class="section">\n'
+        f"                <h2>{point.order}. {html.escape(point.title)}</h2>\n"
+    )
 
-    extra_image_sources = resolve_extra_image_paths(point, meta, output_dir)
-    extra_images_block = render_extra_images_block(point, extra_image_sources)
+    image_src = resolve_image_path(point, images)
+    out.write(render_image_block(point, image_src, BLOCK_INDENT))
 
-    parts.append(indent_block(render_content_blocks(point.content), 16))
+    render_content_blocks(point.content, out, BLOCK_INDENT)
     if point.source:
-        parts.append(
-            f'                <p class="point-source">{html.escape(point.source)}</p>'
+        out.write(
+            f'                <p class="point-source">{html.escape(point.source)}</p>\n'
         )
-    if extra_images_block:
-        parts.append(indent_block(extra_images_block, 16))
-    parts.extend(
-        [
-            "              </td>",
-            "            </tr>",
-        ]
-    )
-    return "\n".join(parts) + "\n"
+    extra_image_sources = resolve_extra_image_paths(point, images)
+    render_extra_images_block(point, extra_image_sources, out, BLOCK_INDENT)
+    out.write("              </td>\n            </tr>\n")
 
 
-def indent_block(text: str, spaces: int) -> str:
-    if not text:
-        return ""
-    prefix = " " * spaces
-    return "\n".join(prefix + line if line else "" for line in text.splitlines())
-
-
-def render_html(
+def render_html_to(
     meta: dict[str, str],
     points: list[Point],
     distribution: list[DistributionSegment],
     output_dir: Path,
-) -> str:
-    title = html.escape(meta["main_title"])
-    subtitle = html.escape(meta["subtitle"])
-    eyebrow = html.escape(meta["eyebrow"])
+    out: TextIO,
+) -> None:
+    esc = {
+        key: html.escape(meta[key])
+        for key in (
+            "main_title",
+            "subtitle",
+            "eyebrow",
+            "tldr_title",
+            "conclusion_title",
+            "address_line",
+            "footer_line",
+            "footer_logo_url",
+            "footer_instagram_icon",
+            "footer_x_icon",
+            "footer_linkedin_icon",
+        )
+    }
     block_height = html.escape(render_block_height(meta["block_height"]))
-    tldr_title = html.escape(meta["tldr_title"])
-    tldr_content = indent_block(render_content_blocks(meta["tldr_content"]), 16)
-    conclusion_title = html.escape(meta["conclusion_title"])
-    conclusion_content = indent_block(render_content_blocks(meta["conclusion_content"]), 16)
-    cta_url = html.escape(meta["cta_url"], quote=True)
-    cta_label = html.escape(meta["cta_label"])
-    address_line = html.escape(meta["address_line"])
-    footer_line = html.escape(meta["footer_line"])
-    footer_logo_url = html.escape(
-        normalize_text(meta.get("footer_logo_url", "public/logotosite.png")),
-        quote=True,
-    )
-    footer_instagram_icon = html.escape(
-        normalize_text(meta.get("footer_instagram_icon", "public/instagram.png")),
-        quote=True,
-    )
-    footer_x_icon = html.escape(
-        normalize_text(meta.get("footer_x_icon", "public/x:twitter.png")),
-        quote=True,
-    )
-    footer_linkedin_icon = html.escape(
-        normalize_text(meta.get("footer_linkedin_icon", "public/linkedin.png")),
-        quote=True,
-    )
-
-    points_html = "".join(render_point(point, meta, output_dir) for point in points)
-    snapshot_html = render_snapshot_section(meta, distribution)
 
-    return f"""<!doctype html>
+    out.write(
+        f"""<!doctype html>
 <html lang="en">
   <head>
     <meta charset="utf-8">
     <meta name="viewport" content="width=device-width, initial-scale=1">
-    <title>{title} - Globalite Macro Brief</title>
+    <title>{esc['main_title']} - Globalite Macro Brief</title>
     <link rel="preconnect" href="https://fonts.googleapis.com">
     <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
     <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@400;500;700&display=swap" rel="stylesheet">
-    <style>
-      body {{
-        margin: 0;
-        padding: 0;
-        background: #f5f5f5;
-        font-family: "Poppins", Arial, sans-serif;
-        color: #1f1f1f;
-        -webkit-print-color-adjust: exact;
-        print-color-adjust: exact;
-      }}
-      table {{ border-collapse: collapse; }}
-      img {{ border: 0; display: block; max-width: 100%; height: auto; }}
-      a {{ color: #ff4202; text-decoration: none; }}
-      .toolbar {{ width: 100%; max-width: 680px; margin: 0 auto; display: flex; justify-content: flex-end; padding: 12px 0 8px; }}
-      .download-pdf-btn {{ border: 1px solid #ff4202; border-radius: 999px; padding: 8px 14px; background: #ffffff; color: #ff4202; font: 600 12px/1 "Poppins", Arial, sans-serif; cursor: pointer; }}
-      .download-pdf-btn:hover {{ background: #fff4ef; }}
-      .wrapper {{ width: 100%; background: #f5f5f5; padding: 32px 0; }}
-      .container {{ width: 680px; max-width: 680px; background: #ffffff; border: 1px solid #e6e6e6; border-radius: 16px; overflow: hidden; }}
-      .divider {{ height: 4px; background: #ff4202; line-height: 4px; }}
-      .header {{ padding: 28px 32px 18px; }}
-      .logo {{ margin: 0 0 16px; text-align: center; }}
-      .logo img {{ width: 190px; margin: 0 auto; }}
-      .eyebrow {{ color: #ff4202; font-weight: 700; font-size: 12px; letter-spacing: 1px; text-transform: uppercase; margin: 0 0 6px; }}
-      h1 {{ margin: 6px 0 6px; font-size: 28px; line-height: 1.2; font-weight: 700; }}
-      .subtitle {{ margin: 0; color: #5f5f5f; font-size: 14px; line-height: 1.6; }}
-      .block-height {{ margin: 12px 0 0; display: inline-block; font-size: 12px; line-height: 1.4; color: #8f3a1a; background: #fff1eb; border: 1px solid #ffd6c8; border-radius: 999px; padding: 6px 10px; }}
-      .section {{ padding: 16px 32px; border-top: 1px solid #f0f0f0; }}
-      .section h2 {{ margin: 0 0 20px; font-size: 18px; font-weight: 700; }}
-      .section p {{ margin: 0; font-size: 14px; line-height: 1.6; }}
-      .section p + p {{ margin-top: 12px; }}
-      .section ul {{ margin: 20px 0 20px 18px; padding: 0; font-size: 14px; line-height: 1.6; }}
-      .section li {{ margin-bottom: 8px; }}
-      .section .point-source {{ margin-top: 14px; font-size: 11px; line-height: 1.5; color: #8a8a8a; }}
-      .image {{ margin: 20px 0; }}
-      .image img {{ width: 100%; border-radius: 12px; border: 1px solid #e6e6e6; }}
-      .caption {{ font-size: 12px; color: #7a7a7a; margin-top: 6px; }}
-      .extra-images {{ margin: 14px 0 0; display: grid; gap: 10px; }}
-      .extra-images img {{ width: 100%; border-radius: 12px; border: 1px solid #e6e6e6; }}
-      .snapshot {{ background: #fcfcfc; }}
-      .snapshot-intro {{ margin: 0 0 14px; font-size: 14px; color: #4f4f4f; }}
-      .snapshot-grid {{ display: grid; grid-template-columns: 1fr 1fr 1fr; gap: 12px; }}
-      .snapshot-card {{ border: 1px solid #ececec; border-radius: 12px; padding: 12px; background: #ffffff; }}
-      .snapshot-card h3 {{ margin: 0 0 10px; font-size: 14px; font-weight: 700; color: #1f1f1f; }}
-      .snapshot-ownership-viz {{ display: flex; justify-content: center; margin: 0 0 10px; }}
-      .snapshot-donut {{ width: 132px; height: 132px; display: block; }}
-      .snapshot-donut-segment {{ fill: none; stroke-width: 24; transform: rotate(-90deg); transform-origin: 60px 60px; }}
-      .snapshot-donut-label {{ font-size: 10px; fill: #8a8a8a; }}
-      .snapshot-donut-value {{ font-size: 10px; fill: #5f5f5f; }}
-      .snapshot-bar {{ width: 100%; height: 24px; border: 1px solid #e6e6e6; border-radius: 8px; overflow: hidden; display: flex; }}
-      .snapshot-bar-segment {{ height: 100%; min-width: 2px; }}
-      .snapshot-legend {{ margin-top: 10px; display: grid; gap: 6px; }}
-      .snapshot-legend-item {{ display: grid; grid-template-columns: 12px 1fr auto; align-items: center; gap: 8px; }}
-      .snapshot-dot {{ width: 10px; height: 10px; border-radius: 999px; display: inline-block; }}
-      .snapshot-name {{ font-size: 12px; color: #3f3f3f; }}
-      .snapshot-value {{ font-size: 12px; color: #5f5f5f; white-space: nowrap; }}
-      .snapshot-circ-value {{ margin: 0 0 8px; font-size: 22px; font-weight: 700; color: #1f1f1f; }}
-      .snapshot-progress-track {{ width: 100%; height: 14px; border: 1px solid #e0e0e0; border-radius: 999px; background: #f0f0f0; overflow: hidden; }}
-      .snapshot-progress-fill {{ height: 100%; background: linear-gradient(90deg, #ff4202 0%, #ff8b61 100%); }}
-      .snapshot-circ-note {{ margin: 8px 0 0; font-size: 12px; color: #666666; }}
-      .snapshot-footnote {{ margin: 12px 0 0; font-size: 12px; color: #7a7a7a; }}
-      .tldr {{ background: #fff8ec; border-top: 2px solid #ff4202; }}
-      .conclusion {{ background: #fff7f3; border-top: 2px solid #ff4202; }}
-      .footer {{ padding: 18px 32px 28px; font-size: 12px; color: #7a7a7a; }}
-      .footer p {{ margin: 0; }}
-      .footer p + p {{ margin-top: 6px; }}
-      .footer-links {{ margin-top: 14px; padding-top: 12px; border-top: 1px solid #ececec; display: grid; grid-template-columns: 1fr 1fr; gap: 10px; }}
-      .footer-panel {{ border: 1px solid #ececec; border-radius: 12px; background: #fafafa; padding: 10px; }}
-      .footer-panel-title {{ margin: 0 0 8px; font-size: 11px; font-weight: 700; letter-spacing: 0.6px; text-transform: uppercase; color: #8a8a8a; font-family: "Poppins", Arial, sans-serif; }}
-      .footer-logo-link {{ display: inline-flex; align-items: center; gap: 8px; color: #1f1f1f; font-size: 12px; font-weight: 600; }}
-      .footer-logo-link img {{ width: 52px; height: 52px; object-fit: cover; border-radius: 20px; border: 1px solid #e0e0e0; }}
-      .footer-social {{ display: flex; flex-direction: column; gap: 6px; }}
-      .footer-social a {{ display: inline-flex; align-items: center; gap: 8px; color: #1f1f1f; font-size: 12px; font-weight: 600; font-family: "Poppins", Arial, sans-serif; }}
-      .footer-social img {{ width: 30px; height: 30px; object-fit: contain; border-radius: 8px; }}
-      @media (max-width: 720px) {{
-        .toolbar {{ padding: 10px 16px 6px; box-sizing: border-box; }}
-        .wrapper {{ padding: 16px 0; }}
-        .container {{ width: 100%; max-width: 100%; border-radius: 0; }}
-        .header, .section, .footer {{ padding: 18px 20px; }}
-        .snapshot-grid {{ grid-template-columns: 1fr; }}
-        .footer-links {{ grid-template-columns: 1fr; }}
-        h1 {{ font-size: 24px; }}
-      }}
-      @media print {{
-        .no-print {{ display: none !important; }}
-        body {{ background: #ffffff; }}
-        .wrapper {{ background: #ffffff; padding: 0; }}
-        .container {{ border: 0; border-radius: 0; }}
-      }}
-    </style>
-  </head>
-  <body>
-    <div class="toolbar no-print">
-      <button class="download-pdf-btn" type="button" onclick="window.print()">Download PDF</button>
-    </div>
-    <table class="wrapper" role="presentation" width="100%" cellpadding="0" cellspacing="0">
-      <tr>
-        <td align="center">
-          <table class="container" role="presentation" cellpadding="0" cellspacing="0">
-            <tr>
-              <td class="divider">&nbsp;</td>
-            </tr>
-            <tr>
-              <td class="header">
-                <div class="logo">
-                  <img src="brand_orange_bg_transparent@2xSite.svg" alt="Globalite">
-                </div>
-                <p class="eyebrow">{eyebrow}</p>
-                <h1>{title}</h1>
-                <p class="subtitle">{subtitle}</p>
+"""
+    )
+    out.write(PAGE_HEAD_STATIC_HTML)
+    out.write(
+        f"""                <p class="eyebrow">{esc['eyebrow']}</p>
+                <h1>{esc['main_title']}</h1>
+                <p class="subtitle">{esc['subtitle']}</p>
                 <p class="block-height">This article was written at block height: <strong>{block_height}</strong></p>
               </td>
             </tr>
-{points_html}
+"""
+    )
+    images = image_settings_from_meta(meta, output_dir)
+    for point in points:
+        render_point(point, images, out)
+    out.write(
+        f"""
             <tr>
               <td class="section tldr">
-                <h2>{tldr_title}</h2>
-{tldr_content}
-              </td>
+                <h2>{esc['tldr_title']}</h2>
+"""
+    )
+    render_content_blocks(meta["tldr_content"], out, BLOCK_INDENT)
+    out.write(
+        f"""              </td>
             </tr>
             <tr>
               <td class="section conclusion">
-                <h2>{conclusion_title}</h2>
-{conclusion_content}
-              </td>
+                <h2>{esc['conclusion_title']}</h2>
+"""
+    )
+    render_content_blocks(meta["conclusion_content"], out, BLOCK_INDENT)
+    out.write(
+        """              </td>
             </tr>
-{snapshot_html}
+"""
+    )
+    render_snapshot_section(meta, distribution, out)
+    out.write(
+        f"""
             <tr>
               <td class="footer">
-                <p>{footer_line}</p>
-                <p>{address_line}</p>
+                <p>{esc['footer_line']}</p>
+                <p>{esc['address_line']}</p>
                 <div class="footer-links">
                   <div class="footer-panel">
                     <p class="footer-panel-title">Site</p>
                     <a class="footer-logo-link" href="https://globalite.co" target="_blank" rel="noopener noreferrer">
-                      <img src="{footer_logo_url}" alt="Globalite logo">
+                      <img src="{esc['footer_logo_url']}" alt="Globalite logo">
                       <span>globalite.co</span>
                     </a>
                   </div>
                   <div class="footer-panel">
                     <p class="footer-panel-title">Socials</p>
                     <div class="footer-social">
-                      <a href="https://www.instagram.com/globalite.sa/" target="_blank" rel="noopener noreferrer"><img src="{footer_instagram_icon}" alt="Instagram"><span>Instagram</span></a>
-                      <a href="https://x.com/globalite_sa" target="_blank" rel="noopener noreferrer"><img src="{footer_x_icon}" alt="X"><span>X</span></a>
-                      <a href="https://www.linkedin.com/company/globalite-sa" target="_blank" rel="noopener noreferrer"><img src="{footer_linkedin_icon}" alt="LinkedIn"><span>LinkedIn</span></a>
+                      <a href="https://www.instagram.com/globalite.sa/" target="_blank" rel="noopener noreferrer"><img src="{esc['footer_instagram_icon']}" alt="Instagram"><span>Instagram</span></a>
+                      <a href="https://x.com/globalite_sa" target="_blank" rel="noopener noreferrer"><img src="{esc['footer_x_icon']}" alt="X"><span>X</span></a>
+                      <a href="https://www.linkedin.com/company/globalite-sa" target="_blank" rel="noopener noreferrer"><img src="{esc['footer_linkedin_icon']}" alt="LinkedIn"><span>LinkedIn</span></a>
                     </div>
                   </div>
                 </div>
@@ -977,21 +1469,20 @@ def render_html(
         </td>
       </tr>
     </table>
-    <script>
-      (function () {{
-        var params = new URLSearchParams(window.location.search);
-        var refreshSeconds = Number(params.get("refresh"));
-        if (!Number.isFinite(refreshSeconds) || refreshSeconds < 5) {{
-          return;
-        }}
-        window.setInterval(function () {{
-          window.location.reload();
-        }}, refreshSeconds * 1000);
-      }})();
-    </script>
-  </body>
-</html>
 """
+    )
+    out.write(PAGE_SCRIPT_HTML)
+
+
+def render_html(
+    meta: dict[str, str],
+    points: list[Point],
+    distribution: list[DistributionSegment],
+    output_dir: Path,
+) -> str:
+    buffer = StringIO()
+    render_html_to(meta, points, distribution, output_dir, buffer)
+    return buffer.getvalue()
 
 
 def parse_args() -> argparse.Namespace:
@@ -1023,6 +1514,23 @@ def parse_args() -> argparse.Namespace:
         default="distribution",
         help="Tab name for distribution in Google Sheets (default: distribution). Optional.",
     )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_CACHE_TTL_SECONDS,
+        help=(
+            "Seconds to reuse cached Google Sheet tabs without re-checking them "
+            f"(default: {DEFAULT_CACHE_TTL_SECONDS:g}). Use 0 to always revalidate."
+        ),
+    )
+    parser.add_argument(
+        "--google-api-key",
+        default=os.environ.get("GOOGLE_SHEETS_API_KEY", ""),
+        help=(
+            "Google Sheets API key. When set, all tabs are fetched in one batchGet "
+            "request instead of one CSV export per tab (default: $GOOGLE_SHEETS_API_KEY)."
+        ),
+    )
     parser.add_argument(
         "--out",
         default="newsletter.html",
@@ -1043,13 +1551,12 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> int:
     args = parse_args()
-    base_dir = Path(__file__).resolve().parent
     xlsx_path = Path(args.xlsx)
     if not xlsx_path.is_absolute():
-        xlsx_path = base_dir / xlsx_path
+        xlsx_path = BASE_DIR / xlsx_path
     out_path = Path(args.out)
     if not out_path.is_absolute():
-        out_path = base_dir / out_path
+        out_path = BASE_DIR / out_path
     google_sheet_ref = normalize_text(args.google_sheet)
 
     if args.init_template:
@@ -1064,22 +1571,34 @@ def main() -> int:
     points: list[Point]
     distribution: list[DistributionSegment]
     backup_path: Path
+    snapshot_status: str
 
     if google_sheet_ref:
         sheet_id = extract_google_sheet_id(google_sheet_ref)
-        meta_rows = fetch_google_sheet_rows(sheet_id, args.google_meta_tab, required=True)
-        points_rows = fetch_google_sheet_rows(
-            sheet_id, args.google_points_tab, required=True
+        tab_rows = fetch_all_google_tabs(
+            sheet_id,
+            args.google_meta_tab,
+            args.google_points_tab,
+            args.google_distribution_tab,
+            cache_ttl=args.cache_ttl,
+            api_key=normalize_text(args.google_api_key),
         )
-        distribution_rows = fetch_google_sheet_rows(
-            sheet_id, args.google_distribution_tab, required=False
-        )
-
-        history_dir = base_dir / "history"
-        history_dir.mkdir(exist_ok=True)
-        backup_path = next_history_workbook_path(history_dir)
-        write_google_snapshot_workbook(
-            backup_path, meta_rows, points_rows, distribution_rows
+        meta_rows = tab_rows["meta"]
+        points_rows = tab_rows["points"]
+        distribution_rows = tab_rows["distribution"]
+
+        # The snapshot workbook is regenerated each run, so its bytes always
+        # differ; compare the fetched rows instead.
+        rows_digest = hashlib.blake2b(
+            json.dumps([meta_rows, points_rows, distribution_rows]).encode("utf-8"),
+            digest_size=8,
+        ).hexdigest()
+        backup_path, snapshot_status = save_history_snapshot(
+            BASE_DIR / "history",
+            rows_digest,
+            lambda path: write_google_snapshot_workbook(
+                path, meta_rows, points_rows, distribution_rows
+            ),
         )
 
         meta = read_meta(TabularSheet(meta_rows))
@@ -1098,34 +1617,35 @@ def main() -> int:
                 "Run with --init-template first to create it."
             )
 
-        history_dir = xlsx_path.parent / "history"
-        history_dir.mkdir(exist_ok=True)
-        backup_path = next_history_workbook_path(history_dir)
-        shutil.copy2(xlsx_path, backup_path)
+        file_digest = hashlib.blake2b(xlsx_path.read_bytes(), digest_size=8).hexdigest()
+        backup_path, snapshot_status = save_history_snapshot(
+            xlsx_path.parent / "history",
+            file_digest,
+            lambda path: copy_workbook_snapshot(xlsx_path, path),
+        )
 
-        workbook = load_workbook(xlsx_path, data_only=True)
-        if "meta" not in workbook.sheetnames:
-            raise ValueError("Workbook is missing required sheet: meta")
-        if "points" not in workbook.sheetnames:
-            raise ValueError("Workbook is missing required sheet: points")
-
-        meta = read_meta(workbook["meta"])
-        points = read_points(workbook["points"])
-        max_supply_btc = parse_number(meta["max_supply_btc"], default=21_000_000)
-        if "distribution" in workbook.sheetnames:
-            distribution = read_distribution(workbook["distribution"], max_supply_btc)
-        else:
-            distribution = default_distribution_segments(max_supply_btc)
+        meta, points, distribution = read_workbook_cached(xlsx_path)
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    html_output = render_html(meta, points, distribution, out_path.parent)
-
-    out_path.write_text(html_output, encoding="utf-8")
+    # Stream into a sibling file and swap it in, so a failed render never
+    # leaves a half-written newsletter behind.
+    partial_path = out_path.with_name(f".{out_path.name}.{os.getpid()}.partial")
+    try:
+        with partial_path.open("w", encoding="utf-8", buffering=1 << 20) as handle:
+            render_html_to(meta, points, distribution, out_path.parent, handle)
+        os.replace(partial_path, out_path)
+    finally:
+        partial_path.unlink(missing_ok=True)
     print(
         f"Generated {out_path} with {len(points)} points "
         f"(max allowed: {MAX_POINTS})."
     )
-    print(f"Source snapshot saved: {backup_path}")
+    if snapshot_status == "linked":
+        print(f"Source unchanged, snapshot linked: {backup_path}")
+    elif snapshot_status == "unchanged":
+        print(f"Source unchanged, no new snapshot created (latest: {backup_path})")
+    else:
+        print(f"Source snapshot saved: {backup_path}")
     return 0
 
 
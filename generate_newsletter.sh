@@ -30,7 +30,12 @@ EOF
 }
 
 run_once() {
-  python3 "$GENERATOR" --google-sheet "$SHEET_URL"
+  if [[ "$WATCH_MODE" == "true" ]]; then
+    # The watch interval already throttles requests; always revalidate the sheet.
+    python3 "$GENERATOR" --google-sheet "$SHEET_URL" --cache-ttl 0
+  else
+    python3 "$GENERATOR" --google-sheet "$SHEET_URL"
+  fi
 }
 
 while [[ $# -gt 0 ]]; do